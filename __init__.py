@@ -4,12 +4,21 @@ from __future__ import annotations
 
 import logging
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 
 from .api import VehicleBasicData
 from .auth import TokenResponse
-from .const import PLATFORMS
+from .const import (
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    PLATFORMS,
+)
 from .coordinator import BMWCarDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,7 +31,7 @@ async def async_setup_entry(
 ) -> bool:
     """Set up BMW CarData from a config entry."""
     # Restore tokens from config entry
-    token_data = entry.data.get("tokens", {})
+    token_data = entry.data.get("tokens")
     if not token_data:
         _LOGGER.error("No token data in config entry — cannot set up")
         return False
@@ -30,17 +39,8 @@ async def async_setup_entry(
     tokens = TokenResponse.from_dict(token_data)
 
     # Restore vehicle list from config entry
-    vehicle_list = entry.data.get("vehicles", [])
-    vehicles = [
-        VehicleBasicData(
-            vin=v["vin"],
-            brand=v.get("brand", "BMW"),
-            model=v.get("model", "Unknown"),
-            propulsion=v.get("propulsion", ""),
-            construction_year=v.get("construction_year"),
-        )
-        for v in vehicle_list
-    ]
+    vehicle_list = entry.data.get("vehicles", ())
+    vehicles = [VehicleBasicData.from_stored(v) for v in vehicle_list]
 
     if not vehicles:
         _LOGGER.error("No vehicles in config entry — cannot set up")
@@ -52,8 +52,29 @@ async def async_setup_entry(
         [(v.vin, v.model) for v in vehicles],
     )
 
+    # Dedicated session per entry so OAuth and REST calls share warm
+    # keep-alive connections instead of re-handshaking TLS on every poll
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        )
+    )
+    # Close the session on unload or failed setup, and on shutdown since
+    # HA does not unload config entries when it stops
+    entry.async_on_unload(session.close)
+
+    async def _async_close_session(event: Event) -> None:
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
     # Create the coordinator
-    coordinator = BMWCarDataCoordinator(hass, entry, vehicles, tokens)
+    coordinator = BMWCarDataCoordinator(hass, entry, vehicles, tokens, session)
 
     # Perform first REST data refresh
     await coordinator.async_config_entry_first_refresh()
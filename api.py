@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
 import aiohttp
+import orjson
 
 from .const import (
     API_BASE_URL,
+    API_MAX_CONCURRENT,
     API_VERSION_HEADER,
     RATE_LIMIT_MAX_CALLS,
     RATE_LIMIT_WINDOW,
@@ -19,6 +22,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAPPINGS_URL = f"{API_BASE_URL}/customers/vehicles/mappings"
+_CONTAINERS_URL = f"{API_BASE_URL}/customers/containers"
+
 
 class RateLimitExceeded(Exception):
     """Raised when the 24h API call budget is exhausted."""
@@ -32,7 +38,7 @@ class APIError(Exception):
         self.status = status
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleBasicData:
     """Basic vehicle information from the API."""
 
@@ -53,9 +59,19 @@ class VehicleBasicData:
             construction_year=data.get("constructionYear"),
         )
 
+    @classmethod
+    def from_stored(cls, data: dict[str, Any]) -> VehicleBasicData:
+        """Deserialize from config entry data."""
+        return cls(
+            vin=data["vin"],
+            brand=data.get("brand", "BMW"),
+            model=data.get("model", "Unknown"),
+            propulsion=data.get("propulsion", ""),
+            construction_year=data.get("construction_year"),
+        )
+
 
-@dataclass
-class TelematicEntry:
+class TelematicEntry(NamedTuple):
     """Single telemetric data point."""
 
     name: str
@@ -64,14 +80,38 @@ class TelematicEntry:
     timestamp: str  # ISO 8601
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleData:
-    """Aggregated vehicle data from REST and MQTT sources."""
+    """Aggregated vehicle data from REST and MQTT sources.
+
+    Telemetry is stored as parallel descriptor-keyed dicts rather than one
+    dict of entries, so state reads need a single lookup for the value.
+    """
 
     basic: VehicleBasicData
-    telemetry: dict[str, TelematicEntry] = field(default_factory=dict)
+    values: dict[str, str] = field(default_factory=dict)
+    units: dict[str, str | None] = field(default_factory=dict)
     rest_updated: float | None = None
     mqtt_updated: float | None = None
+    _sorted_keys: tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def sorted_telemetry_keys(self) -> tuple[str, ...]:
+        """Return telemetry keys in sorted order, re-sorting only on change.
+
+        Descriptors are only ever added, so a length change means new keys.
+        """
+        if len(self._sorted_keys) != len(self.values):
+            self._sorted_keys = tuple(sorted(self.values))
+        return self._sorted_keys
+
+
+class _VinUrls(NamedTuple):
+    """Per-VIN endpoint URLs, formatted once and reused on every poll."""
+
+    basic: str
+    telematic: str
 
 
 class BMWCarDataAPI:
@@ -80,12 +120,22 @@ class BMWCarDataAPI:
     def __init__(self, session: aiohttp.ClientSession) -> None:
         """Initialize with an aiohttp session."""
         self._session = session
-        self._access_token: str = ""
+        self._headers: dict[str, str] = {}
+        self._json_headers: dict[str, str] = {}
+        self._vin_urls: dict[str, _VinUrls] = {}
+        self._inflight = asyncio.Semaphore(API_MAX_CONCURRENT)
+        # Monotonic timestamps of calls within the last RATE_LIMIT_WINDOW
         self._call_log: deque[float] = deque()
+        self.set_token("")
 
     def set_token(self, access_token: str) -> None:
-        """Update the access token used for API calls."""
-        self._access_token = access_token
+        """Update the access token and rebuild the cached request headers."""
+        self._headers = {
+            "Authorization": "Bearer " + access_token,
+            "x-version": API_VERSION_HEADER,
+            "Accept": "application/json",
+        }
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
 
     @property
     def remaining_calls(self) -> int:
@@ -95,61 +145,91 @@ class BMWCarDataAPI:
 
     def _prune_call_log(self) -> None:
         """Remove call timestamps older than the rate limit window."""
-        cutoff = time.time() - RATE_LIMIT_WINDOW
+        cutoff = time.monotonic() - RATE_LIMIT_WINDOW
         while self._call_log and self._call_log[0] < cutoff:
             self._call_log.popleft()
 
-    def _check_rate_limit(self) -> None:
-        """Raise RateLimitExceeded if budget is exhausted."""
+    def _check_rate_limit(self) -> float:
+        """Reserve one call from the budget, or raise RateLimitExceeded.
+
+        The call is logged before the request is sent, so concurrent
+        requests can't all pass the check ahead of the first one landing.
+        Returns the reservation timestamp for _release_call.
+        """
         self._prune_call_log()
         if len(self._call_log) >= RATE_LIMIT_MAX_CALLS:
             oldest = self._call_log[0]
-            reset_in = int(oldest + RATE_LIMIT_WINDOW - time.time())
+            reset_in = int(oldest + RATE_LIMIT_WINDOW - time.monotonic())
             raise RateLimitExceeded(
                 f"Rate limit reached ({RATE_LIMIT_MAX_CALLS} calls). "
                 f"Resets in {reset_in}s."
             )
+        stamp = time.monotonic()
+        self._call_log.append(stamp)
+        return stamp
+
+    def _release_call(self, stamp: float) -> None:
+        """Give back a reserved call that never reached the server."""
+        try:
+            self._call_log.remove(stamp)
+        except ValueError:
+            pass  # already pruned out of the window
+
+    def _urls(self, vin: str) -> _VinUrls:
+        """Return the endpoint URLs for a VIN, formatting them on first use."""
+        urls = self._vin_urls.get(vin)
+        if urls is None:
+            base = f"{API_BASE_URL}/customers/vehicles/{vin}"
+            urls = self._vin_urls[vin] = _VinUrls(
+                basic=f"{base}/basicData",
+                telematic=f"{base}/telematicData",
+            )
+        return urls
 
-    def _record_call(self) -> None:
-        """Record a successful API call timestamp."""
-        self._call_log.append(time.time())
-
-    def _headers(self) -> dict[str, str]:
-        """Build request headers."""
-        return {
-            "Authorization": f"Bearer {self._access_token}",
-            "x-version": API_VERSION_HEADER,
-            "Accept": "application/json",
-        }
+    async def _request_status(
+        self, method: str, url: str, **kwargs: Any
+    ) -> tuple[int, Any]:
+        """Make an authenticated API request without raising on HTTP errors.
 
-    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
-        """Make an authenticated API request with rate limiting."""
-        self._check_rate_limit()
+        Returns (status, result) where result is the decoded JSON body on
+        2xx responses (None if empty) and the truncated response text
+        otherwise. RateLimitExceeded and transport errors still propagate.
+        """
+        stamp = self._check_rate_limit()
 
-        url = f"{API_BASE_URL}{path}"
         _LOGGER.debug("API %s %s", method, url)
 
-        async with self._session.request(
-            method, url, headers=self._headers(), **kwargs
-        ) as resp:
-            self._record_call()
-            _LOGGER.debug(
-                "API response %s (remaining calls: %d)",
-                resp.status,
-                self.remaining_calls,
-            )
+        try:
+            async with self._inflight, self._session.request(
+                method, url, headers=self._headers, **kwargs
+            ) as resp:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "API response %s (remaining calls: %d)",
+                        resp.status,
+                        self.remaining_calls,
+                    )
 
-            if resp.status == 401:
-                raise APIError(401, "Unauthorized — token may be expired")
-            if resp.status == 429:
-                raise APIError(429, "Rate limited by BMW API server")
-            if not 200 <= resp.status < 300:
-                body = await resp.text()
-                raise APIError(resp.status, body[:500])
+                if not 200 <= resp.status < 300:
+                    return resp.status, (await resp.text())[:500]
+                if resp.content_length == 0:
+                    return resp.status, None
+                return resp.status, await resp.json(loads=orjson.loads)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._release_call(stamp)
+            raise
 
-            if resp.content_length == 0:
-                return None
-            return await resp.json()
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Make an authenticated API request with rate limiting."""
+        status, result = await self._request_status(method, url, **kwargs)
+
+        if status == 401:
+            raise APIError(401, "Unauthorized — token may be expired")
+        if status == 429:
+            raise APIError(429, "Rate limited by BMW API server")
+        if not 200 <= status < 300:
+            raise APIError(status, result)
+        return result
 
     # ── Vehicle Discovery ────────────────────────────────────────────────
 
@@ -159,7 +239,7 @@ class BMWCarDataAPI:
         Endpoint: GET /customers/vehicles/mappings
         Returns a list of VIN strings, extracted from mapping objects.
         """
-        result = await self._request("GET", "/customers/vehicles/mappings")
+        result = await self._request("GET", _MAPPINGS_URL)
         items = result if isinstance(result, list) else result.get("mappings", [])
         vins: list[str] = []
         for item in items:
@@ -174,7 +254,7 @@ class BMWCarDataAPI:
 
         Endpoint: GET /customers/vehicles/{vin}/basicData
         """
-        result = await self._request("GET", f"/customers/vehicles/{vin}/basicData")
+        result = await self._request("GET", self._urls(vin).basic)
         return VehicleBasicData.from_api(result)
 
     # ── Telemetric Data ──────────────────────────────────────────────────
@@ -191,36 +271,39 @@ class BMWCarDataAPI:
         """
         result = await self._request(
             "GET",
-            f"/customers/vehicles/{vin}/telematicData",
+            self._urls(vin).telematic,
             params={"containerId": container_id},
         )
 
-        entries: list[TelematicEntry] = []
         if not result:
-            return entries
+            return []
 
         # Response is {"telematicData": {key: {value, unit, timestamp}}}
         telematic_data = result.get("telematicData", {})
-        if isinstance(telematic_data, dict):
-            for descriptor, data in telematic_data.items():
-                if not isinstance(data, dict):
-                    continue
-                value = data.get("value")
-                if value is None:
-                    continue
-                entries.append(
-                    TelematicEntry(
-                        name=descriptor,
-                        value=str(value),
-                        unit=data.get("unit"),
-                        timestamp=data.get("timestamp", ""),
-                    )
-                )
-        else:
+        if not isinstance(telematic_data, dict):
             _LOGGER.warning(
                 "Unexpected telematicData format: %s", type(telematic_data)
             )
+            return []
 
+        entries: list[TelematicEntry] = []
+        for descriptor, data in telematic_data.items():
+            if not isinstance(data, dict):
+                continue
+            value = data.get("value")
+            if value is None:
+                continue
+            # Most BMW values already arrive as strings
+            if type(value) is not str:
+                value = str(value)
+            entries.append(
+                TelematicEntry(
+                    descriptor,
+                    value,
+                    data.get("unit"),
+                    data.get("timestamp", ""),
+                )
+            )
         return entries
 
     # ── Container Management ─────────────────────────────────────────────
@@ -230,7 +313,7 @@ class BMWCarDataAPI:
 
         Endpoint: GET /customers/containers
         """
-        result = await self._request("GET", "/customers/containers")
+        result = await self._request("GET", _CONTAINERS_URL)
         if isinstance(result, list):
             return result
         return result.get("containers", [])
@@ -248,18 +331,20 @@ class BMWCarDataAPI:
             "purpose": purpose,
             "technicalDescriptors": descriptors,
         }
-        headers = {**self._headers(), "Content-Type": "application/json"}
-
-        self._check_rate_limit()
-        url = f"{API_BASE_URL}/customers/containers"
-        _LOGGER.debug("API POST %s", url)
-
-        async with self._session.post(url, headers=headers, json=body) as resp:
-            self._record_call()
-            if not 200 <= resp.status < 300:
-                text = await resp.text()
-                raise APIError(resp.status, text[:500])
-            result = await resp.json()
+        stamp = self._check_rate_limit()
+        _LOGGER.debug("API POST %s", _CONTAINERS_URL)
+
+        try:
+            async with self._inflight, self._session.post(
+                _CONTAINERS_URL, headers=self._json_headers, json=body
+            ) as resp:
+                if not 200 <= resp.status < 300:
+                    text = await resp.text()
+                    raise APIError(resp.status, text[:500])
+                result = await resp.json(loads=orjson.loads)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._release_call(stamp)
+            raise
 
         container_id = result.get("containerId", "")
         _LOGGER.info("Created container '%s' with ID: %s", name, container_id)
@@ -269,18 +354,28 @@ class BMWCarDataAPI:
 
     async def discover_vehicles(self) -> list[VehicleBasicData]:
         """Discover all vehicles: get VIN list then fetch basic data for each."""
-        vins = await self.get_vehicle_mappings()
+        vins = [vin for vin in await self.get_vehicle_mappings() if vin]
         _LOGGER.debug("Discovered VINs: %s", vins)
-        vehicles: list[VehicleBasicData] = []
-        for vin in vins:
-            try:
-                basic = await self.get_vehicle_basic_data(vin)
-                # Always use VIN from mappings — basicData may not include it
-                basic.vin = vin
-                vehicles.append(basic)
-            except APIError as err:
-                _LOGGER.warning("Failed to get basic data for %s: %s", vin, err)
-                vehicles.append(
-                    VehicleBasicData(vin=vin, brand="BMW", model="Unknown", propulsion="")
-                )
-        return vehicles
+        return list(
+            await asyncio.gather(*(self._discover_vehicle(vin) for vin in vins))
+        )
+
+    async def _discover_vehicle(self, vin: str) -> VehicleBasicData:
+        """Fetch basic data for one VIN, with a placeholder on any failure."""
+        try:
+            status, data = await self._request_status("GET", self._urls(vin).basic)
+        except Exception as err:
+            _LOGGER.warning("Failed to get basic data for %s: %s", vin, err)
+            return VehicleBasicData(vin=vin, brand="BMW", model="Unknown", propulsion="")
+
+        if not 200 <= status < 300:
+            _LOGGER.warning(
+                "Failed to get basic data for %s: API error %s: %s",
+                vin, status, data,
+            )
+            return VehicleBasicData(vin=vin, brand="BMW", model="Unknown", propulsion="")
+
+        basic = VehicleBasicData.from_api(data or {})
+        # Always use VIN from mappings — basicData may not include it
+        basic.vin = vin
+        return basic
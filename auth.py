@@ -7,14 +7,18 @@ import hashlib
 import logging
 import secrets
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import (
     DEVICE_CODE_URL,
     OAUTH_SCOPES,
+    TOKEN_REFRESH_FRACTION,
+    TOKEN_REFRESH_MARGIN_MAX,
+    TOKEN_REFRESH_MARGIN_MIN,
     TOKEN_URL,
 )
 
@@ -26,19 +30,21 @@ _LOGGER = logging.getLogger(__name__)
 
 def generate_code_verifier() -> str:
     """Generate a 128-character URL-safe random code verifier."""
-    return secrets.token_urlsafe(96)[:128]
+    # 96 random bytes encode to exactly 128 base64url characters
+    return secrets.token_urlsafe(96)
 
 
 def generate_code_challenge(verifier: str) -> str:
     """Generate S256 code challenge from verifier."""
     digest = hashlib.sha256(verifier.encode("ascii")).digest()
-    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+    # A 32-byte digest always encodes to 43 chars plus a single "=" pad
+    return base64.urlsafe_b64encode(digest)[:43].decode("ascii")
 
 
 # ── Data Classes ─────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCodeResponse:
     """Response from the device code endpoint."""
 
@@ -50,9 +56,14 @@ class DeviceCodeResponse:
     interval: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenResponse:
-    """Token set from the token endpoint."""
+    """Token set from the token endpoint.
+
+    token_time is wall-clock so it survives restarts when persisted. Within
+    the running process, expiry checks use monotonic_expiry instead, which
+    is anchored to time.monotonic() on construction and immune to clock jumps.
+    """
 
     access_token: str
     refresh_token: str
@@ -60,12 +71,37 @@ class TokenResponse:
     expires_in: int
     gcid: str
     token_time: float  # time.time() when tokens were obtained
+    _mono_base: float = field(init=False, repr=False, compare=False)
+    _refresh_at: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Map token_time onto the monotonic clock."""
+        self._mono_base = time.monotonic() - (time.time() - self.token_time)
+        self._refresh_at = self.monotonic_expiry - self.refresh_margin
 
     @property
     def expiry_timestamp(self) -> float:
         """Absolute expiry time."""
         return self.token_time + self.expires_in
 
+    @property
+    def monotonic_expiry(self) -> float:
+        """Expiry time on the time.monotonic() clock."""
+        return self._mono_base + self.expires_in
+
+    @property
+    def refresh_margin(self) -> float:
+        """Seconds before expiry at which the token should be refreshed."""
+        return min(
+            TOKEN_REFRESH_MARGIN_MAX,
+            max(TOKEN_REFRESH_MARGIN_MIN, self.expires_in * TOKEN_REFRESH_FRACTION),
+        )
+
+    @property
+    def monotonic_refresh_at(self) -> float:
+        """Monotonic deadline after which the token should be refreshed."""
+        return self._refresh_at
+
     def as_dict(self) -> dict[str, Any]:
         """Serialize for storage in config entry data."""
         return {
@@ -110,6 +146,10 @@ class TokenRefreshFailed(AuthError):
     """Refresh token is invalid or expired."""
 
 
+class TransientAuthError(AuthError):
+    """5xx reply or unparseable success reply that may succeed on retry."""
+
+
 # ── OAuth Client ─────────────────────────────────────────────────────────────
 
 
@@ -121,6 +161,7 @@ class BMWAuth:
         self._session = session
         self._client_id = client_id
         self._code_verifier: str | None = None
+        self._code_challenge: str | None = None
 
     @property
     def code_verifier(self) -> str | None:
@@ -129,8 +170,9 @@ class BMWAuth:
 
     @code_verifier.setter
     def code_verifier(self, value: str) -> None:
-        """Set the code verifier (for restoring from persistence)."""
+        """Set the code verifier and precompute its S256 challenge."""
         self._code_verifier = value
+        self._code_challenge = generate_code_challenge(value)
 
     async def request_device_code(self) -> DeviceCodeResponse:
         """Request a device code for user authorization.
@@ -138,14 +180,13 @@ class BMWAuth:
         Returns the device code response containing the user_code and
         verification URL that the user must visit.
         """
-        self._code_verifier = generate_code_verifier()
-        challenge = generate_code_challenge(self._code_verifier)
+        self.code_verifier = generate_code_verifier()
 
         data = {
             "client_id": self._client_id,
             "response_type": "device_code",
             "scope": OAUTH_SCOPES,
-            "code_challenge": challenge,
+            "code_challenge": self._code_challenge,
             "code_challenge_method": "S256",
         }
 
@@ -153,7 +194,7 @@ class BMWAuth:
             if resp.status != 200:
                 body = await resp.text()
                 raise AuthError(f"Device code request failed ({resp.status}): {body}")
-            result = await resp.json()
+            result = await resp.json(loads=orjson.loads)
 
         return DeviceCodeResponse(
             device_code=result["device_code"],
@@ -170,7 +211,8 @@ class BMWAuth:
         """Poll the token endpoint once.
 
         Raises AuthorizationPending if the user hasn't authorized yet,
-        SlowDown if polling too fast, or DeviceCodeExpired if expired.
+        SlowDown if polling too fast, DeviceCodeExpired if expired, or
+        TransientAuthError on a 5xx or an unparseable 2xx reply.
         Returns TokenResponse on success.
         """
         if not self._code_verifier:
@@ -184,7 +226,24 @@ class BMWAuth:
         }
 
         async with self._session.post(TOKEN_URL, data=data) as resp:
-            body = await resp.json(content_type=None)
+            try:
+                body = await resp.json(loads=orjson.loads, content_type=None)
+            except orjson.JSONDecodeError as err:
+                if 400 <= resp.status < 500:
+                    body = {}  # mapped by status below
+                else:
+                    raise TransientAuthError(
+                        f"Token poll returned a non-JSON body ({resp.status})"
+                    ) from err
+
+            if resp.status >= 500:
+                raise TransientAuthError(f"Token poll failed ({resp.status})")
+            if not isinstance(body, dict):
+                if resp.status == 200:
+                    raise TransientAuthError(
+                        f"Token poll returned an unexpected body ({resp.status})"
+                    )
+                body = {}  # mapped by status below
 
             if resp.status == 200:
                 _LOGGER.debug(
@@ -223,7 +282,7 @@ class BMWAuth:
         }
 
         async with self._session.post(TOKEN_URL, data=data) as resp:
-            body = await resp.json(content_type=None)
+            body = await resp.json(loads=orjson.loads, content_type=None)
 
             if resp.status == 200:
                 return TokenResponse(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from homeassistant.components.binary_sensor import (
@@ -11,53 +12,69 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BMWCarDataConfigEntry
-from .const import BINARY_SENSOR_KEY_MAP, DOMAIN
+from .const import BINARY_SENSOR_DESCRIPTORS
 from .coordinator import BMWCarDataCoordinator
+from .entity import BMWCarDataEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-# Map string device class names to BinarySensorDeviceClass enum
-_DEVICE_CLASS_MAP: dict[str, BinarySensorDeviceClass] = {
-    "door": BinarySensorDeviceClass.DOOR,
-    "window": BinarySensorDeviceClass.WINDOW,
-    "lock": BinarySensorDeviceClass.LOCK,
-    "battery_charging": BinarySensorDeviceClass.BATTERY_CHARGING,
-    "plug": BinarySensorDeviceClass.PLUG,
-}
+# Share one frozenset object between descriptions with identical on-values
+_ON_VALUES_CACHE: dict[frozenset[str], frozenset[str]] = {}
 
 
-@dataclass(frozen=True, kw_only=True)
+# eq=False keeps the base EntityDescription __eq__/__hash__, which skip the
+# on_values frozenset and matcher added here
+@dataclass(frozen=True, kw_only=True, eq=False)
 class BMWBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describe a BMW CarData binary sensor entity."""
 
     telemetry_key: str
     on_values: frozenset[str]
+    # Tests a raw value against on_values; plain equality for single values
+    is_on_value: Callable[[str], bool]
 
 
-def _build_descriptions() -> list[BMWBinarySensorEntityDescription]:
-    """Build binary sensor descriptions from BINARY_SENSOR_KEY_MAP."""
+def _build_descriptions() -> tuple[BMWBinarySensorEntityDescription, ...]:
+    """Build binary sensor descriptions from BINARY_SENSOR_DESCRIPTORS."""
     descriptions: list[BMWBinarySensorEntityDescription] = []
 
-    for telemetry_key, (
+    for (
+        telemetry_key,
         translation_key,
         device_class_str,
         on_values,
-    ) in BINARY_SENSOR_KEY_MAP.items():
+    ) in BINARY_SENSOR_DESCRIPTORS:
+        on_values_set = frozenset(on_values)
+        on_values_set = _ON_VALUES_CACHE.setdefault(on_values_set, on_values_set)
         descriptions.append(
             BMWBinarySensorEntityDescription(
                 key=translation_key,
                 translation_key=translation_key,
                 telemetry_key=telemetry_key,
-                device_class=_DEVICE_CLASS_MAP.get(device_class_str) if device_class_str else None,
-                on_values=frozenset(on_values),
+                # Map strings are BinarySensorDeviceClass (StrEnum) values
+                device_class=(
+                    BinarySensorDeviceClass(device_class_str)
+                    if device_class_str
+                    else None
+                ),
+                on_values=on_values_set,
+                is_on_value=(
+                    next(iter(on_values_set)).__eq__
+                    if len(on_values_set) == 1
+                    else on_values_set.__contains__
+                ),
             )
         )
 
-    return descriptions
+    return tuple(descriptions)
+
+
+# Descriptions depend only on constants, so build them once at import
+BINARY_SENSOR_DESCRIPTIONS = _build_descriptions()
 
 
 async def async_setup_entry(
@@ -67,61 +84,46 @@ async def async_setup_entry(
 ) -> None:
     """Set up BMW CarData binary sensor entities."""
     coordinator: BMWCarDataCoordinator = entry.runtime_data
-    descriptions = _build_descriptions()
-
-    entities: list[BMWBinarySensor] = []
-    for vin in coordinator.data:
-        for desc in descriptions:
-            entities.append(BMWBinarySensor(coordinator, desc, vin, entry))
 
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            BMWBinarySensor(coordinator, desc, vin, device_info, entry)
+            for vin, device_info in coordinator.device_info.items()
+            for desc in BINARY_SENSOR_DESCRIPTIONS
+        ]
+    )
 
 
-class BMWBinarySensor(
-    CoordinatorEntity[BMWCarDataCoordinator], BinarySensorEntity
-):
+class BMWBinarySensor(BMWCarDataEntity, BinarySensorEntity):
     """Representation of a BMW CarData binary sensor."""
 
+    # Base entity classes keep a __dict__; slot only our own per-instance state
+    __slots__ = ("_values", "_telemetry_key", "_is_on_value")
+
     entity_description: BMWBinarySensorEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: BMWCarDataCoordinator,
         description: BMWBinarySensorEntityDescription,
         vin: str,
+        device_info: DeviceInfo,
         entry: BMWCarDataConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, vin)
         self.entity_description = description
-        self._vin = vin
+        # The vehicle's values dict is never replaced, so bind it once
+        self._values = coordinator.data[vin].values
+        self._telemetry_key = description.telemetry_key
+        self._is_on_value = description.is_on_value
         self._attr_unique_id = f"{vin}_{description.key}"
-
-        vehicle = coordinator.vehicles.get(vin)
-        model = vehicle.model if vehicle else "Unknown"
-        brand = vehicle.brand if vehicle else "BMW"
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, vin)},
-            "name": f"{brand} {model}",
-            "manufacturer": brand,
-            "model": model,
-            "serial_number": vin,
-        }
+        self._attr_device_info = device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return True if the binary sensor is on."""
-        if not self.coordinator.data:
+        value = self._values.get(self._telemetry_key)
+        if value is None:
             return None
-
-        vehicle = self.coordinator.data.get(self._vin)
-        if not vehicle:
-            return None
-
-        entry = vehicle.telemetry.get(self.entity_description.telemetry_key)
-        if not entry:
-            return None
-
-        return entry.value in self.entity_description.on_values
+        return self._is_on_value(value)
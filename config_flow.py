@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import BMWCarDataAPI, VehicleBasicData
@@ -20,8 +23,15 @@ from .auth import (
     DeviceCodeResponse,
     SlowDown,
     TokenResponse,
+    TransientAuthError,
+)
+from .const import (
+    AUTH_POLL_BACKOFF_MAX,
+    AUTH_POLL_INTERVAL_MAX,
+    AUTH_POLL_MAX_SLOWDOWNS,
+    CONF_CLIENT_ID,
+    DOMAIN,
 )
-from .const import CONF_CLIENT_ID, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +46,8 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
         self._client_id: str = ""
         self._auth: BMWAuth | None = None
         self._device_code_resp: DeviceCodeResponse | None = None
+        # (schema, placeholders) for the open_link form, built per device code
+        self._open_link_form: tuple[vol.Schema, dict[str, str]] | None = None
         self._tokens: TokenResponse | None = None
         self._vehicles: list[VehicleBasicData] = []
         self._reauth_entry: ConfigEntry | None = None
@@ -57,6 +69,7 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
 
             try:
                 self._device_code_resp = await self._auth.request_device_code()
+                self._open_link_form = None
             except AuthError as err:
                 _LOGGER.error("Failed to request device code: %s", err)
                 errors["base"] = "device_code_failed"
@@ -88,21 +101,27 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
             # User clicked Submit — start polling
             return await self.async_step_authorize()
 
-        url = self._device_code_resp.verification_uri_complete
-        code = self._device_code_resp.user_code
+        if self._open_link_form is None:
+            url = self._device_code_resp.verification_uri_complete
+            code = self._device_code_resp.user_code
+            self._open_link_form = (
+                vol.Schema(
+                    {
+                        vol.Optional("verification_url", default=url): str,
+                        vol.Optional("user_code", default=code): str,
+                    }
+                ),
+                {
+                    "url": url,
+                    "code": code,
+                },
+            )
+        data_schema, placeholders = self._open_link_form
 
         return self.async_show_form(
             step_id="open_link",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional("verification_url", default=url): str,
-                    vol.Optional("user_code", default=code): str,
-                }
-            ),
-            description_placeholders={
-                "url": url,
-                "code": code,
-            },
+            data_schema=data_schema,
+            description_placeholders=placeholders,
         )
 
     # ── Step 2b: Poll for Authorization ──────────────────────────────────
@@ -122,7 +141,8 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
         # Create the background polling task once
         if self._login_task is None:
             self._login_task = self.hass.async_create_task(
-                self._poll_for_authorization()
+                self._poll_for_authorization(),
+                name="bmw_cardata_device_code_poll",
             )
 
         # Re-entry: task has completed
@@ -149,23 +169,51 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
         if not self._auth or not self._device_code_resp:
             raise AuthError("Missing auth or device code")
 
+        loop = asyncio.get_running_loop()
+        device_code = self._device_code_resp.device_code
         interval = self._device_code_resp.interval
-        deadline = (
-            asyncio.get_event_loop().time()
-            + self._device_code_resp.expires_in
-        )
+        deadline = loop.time() + self._device_code_resp.expires_in
 
-        while asyncio.get_event_loop().time() < deadline:
-            await asyncio.sleep(interval)
+        delay = interval
+        failures = 0
+        capped_slowdowns = 0
+
+        # Stop as soon as the next poll would land past the code's expiry
+        while loop.time() + delay < deadline:
+            await asyncio.sleep(delay)
+            delay = interval
             try:
-                self._tokens = await self._auth.poll_for_token(
-                    self._device_code_resp.device_code
-                )
+                self._tokens = await self._auth.poll_for_token(device_code)
                 return  # Success — task completes, framework re-invokes step
             except AuthorizationPending:
+                failures = 0
+                capped_slowdowns = 0
                 continue
             except SlowDown:
-                interval = min(interval + 2, 10)
+                if interval >= AUTH_POLL_INTERVAL_MAX:
+                    capped_slowdowns += 1
+                    if capped_slowdowns > AUTH_POLL_MAX_SLOWDOWNS:
+                        _LOGGER.error("BMW kept throttling token polls, giving up")
+                        raise DeviceCodeExpired(
+                            "Server-imposed backoff cap reached"
+                        ) from None
+                interval = min(interval + 2, AUTH_POLL_INTERVAL_MAX)
+                delay = interval
+                continue
+            except (
+                aiohttp.ClientError, asyncio.TimeoutError, TransientAuthError
+            ) as err:
+                # Transient network or server failure: truncated exponential
+                # backoff plus up to 50% jitter on top, so even the first
+                # retry is spread out and never faster than the server interval
+                backoff = max(
+                    interval, min(AUTH_POLL_BACKOFF_MAX, interval * 2**failures)
+                )
+                delay = backoff * random.uniform(1, 1.5)
+                failures += 1
+                _LOGGER.debug(
+                    "Token poll failed, retrying in %.1fs: %s", delay, err
+                )
                 continue
             except DeviceCodeExpired:
                 _LOGGER.error("Device code expired before user authorized")
@@ -176,6 +224,12 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
 
         raise DeviceCodeExpired("Polling deadline exceeded")
 
+    @callback
+    def async_remove(self) -> None:
+        """Cancel the token poll if the flow is abandoned mid-authorization."""
+        if self._login_task and not self._login_task.done():
+            self._login_task.cancel()
+
     async def async_step_authorize_failed(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -197,27 +251,9 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
             api.set_token(self._tokens.access_token)
 
             try:
-                vins = await api.get_vehicle_mappings()
-                _LOGGER.debug("Discovered VINs from mappings: %s", vins)
-
-                for vin in vins:
-                    if not vin:
-                        continue
-                    try:
-                        basic = await api.get_vehicle_basic_data(vin)
-                        # Always use VIN from mappings — basicData may omit it
-                        basic.vin = vin
-                        self._vehicles.append(basic)
-                    except Exception as err:
-                        _LOGGER.warning(
-                            "Failed to get basic data for %s: %s", vin, err
-                        )
-                        self._vehicles.append(
-                            VehicleBasicData(
-                                vin=vin, brand="BMW", model="Unknown",
-                                propulsion="",
-                            )
-                        )
+                # Basic data for all VINs is fetched concurrently; a VIN that
+                # fails gets a placeholder rather than aborting discovery
+                self._vehicles = await api.discover_vehicles()
             except Exception as err:
                 _LOGGER.error("Vehicle discovery failed: %s", err)
                 return self.async_abort(reason="discovery_failed")
@@ -248,20 +284,23 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(primary_vin)
         self._abort_if_unique_id_configured()
 
-        vehicle_data = [
-            {
-                "vin": v.vin,
-                "brand": v.brand,
-                "model": v.model,
-                "propulsion": v.propulsion,
-                "construction_year": v.construction_year,
-            }
-            for v in valid_vehicles
-        ]
+        vehicle_data: list[dict[str, Any]] = []
+        names: list[str] = []
+        for v in valid_vehicles:
+            vehicle_data.append(
+                {
+                    "vin": v.vin,
+                    "brand": v.brand,
+                    "model": v.model,
+                    "propulsion": v.propulsion,
+                    "construction_year": v.construction_year,
+                }
+            )
+            names.append(f"{v.brand} {v.model}")
 
         _LOGGER.info("Creating config entry with VINs: %s", [v["vin"] for v in vehicle_data])
 
-        title = ", ".join(f"{v.brand} {v.model}" for v in valid_vehicles)
+        title = ", ".join(names)
 
         return self.async_create_entry(
             title=title,
@@ -294,6 +333,7 @@ class BMWCarDataConfigFlow(ConfigFlow, domain=DOMAIN):
 
             try:
                 self._device_code_resp = await self._auth.request_device_code()
+                self._open_link_form = None
             except AuthError as err:
                 _LOGGER.error("Reauth device code failed: %s", err)
                 return self.async_abort(reason="device_code_failed")
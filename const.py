@@ -8,7 +8,7 @@ from typing import Final
 
 DOMAIN: Final = "bmw_cardata"
 
-PLATFORMS: Final = ["sensor", "binary_sensor", "device_tracker"]
+PLATFORMS: Final = ("sensor", "binary_sensor", "device_tracker")
 
 # ── OAuth 2.0 Endpoints ─────────────────────────────────────────────────────
 
@@ -22,11 +22,21 @@ OAUTH_SCOPES: Final = "authenticate_user openid cardata:api:read cardata:streami
 API_BASE_URL: Final = "https://api-cardata.bmwgroup.com"
 API_VERSION_HEADER: Final = "v1"
 
+# ── HTTP Connection Pool ────────────────────────────────────────────────────
+
+HTTP_POOL_LIMIT: Final = 20
+HTTP_POOL_LIMIT_PER_HOST: Final = 8
+# In-flight REST calls per client, one per pooled connection to the API host
+API_MAX_CONCURRENT: Final = HTTP_POOL_LIMIT_PER_HOST
+HTTP_KEEPALIVE_TIMEOUT: Final = 75  # Outlive BMW's idle timeout to avoid re-handshakes
+HTTP_DNS_CACHE_TTL: Final = 300
+
 # ── MQTT Streaming ───────────────────────────────────────────────────────────
 
 MQTT_BROKER: Final = "customer.streaming-cardata.bmwgroup.com"
 MQTT_PORT: Final = 9000
 MQTT_KEEPALIVE: Final = 30
+MQTT_UPDATE_DEBOUNCE: Final = 0.1  # Seconds to coalesce entity updates
 
 # ── Rate Limiting ────────────────────────────────────────────────────────────
 
@@ -36,7 +46,13 @@ RATE_LIMIT_WINDOW: Final = 86400  # 24 hours in seconds
 # ── Polling / Timing ────────────────────────────────────────────────────────
 
 DEFAULT_POLL_INTERVAL: Final = 2400  # 40 minutes
-TOKEN_REFRESH_MARGIN: Final = 300  # Refresh 5 minutes before expiry
+# Refresh a quarter of the token lifetime early, clamped to [1, 10] minutes
+TOKEN_REFRESH_FRACTION: Final = 0.25
+TOKEN_REFRESH_MARGIN_MIN: Final = 60
+TOKEN_REFRESH_MARGIN_MAX: Final = 600
+AUTH_POLL_BACKOFF_MAX: Final = 30  # Cap for device-code poll retry delay
+AUTH_POLL_INTERVAL_MAX: Final = 10  # Cap for slow_down interval increases
+AUTH_POLL_MAX_SLOWDOWNS: Final = 5  # slow_down replies tolerated at the cap
 
 # ── MQTT Reconnection ───────────────────────────────────────────────────────
 
@@ -74,50 +90,57 @@ DEFAULT_CONTAINER_PURPOSE: Final = "Home Assistant telemetry"
 # ── Telemetry Key → Sensor Mapping ──────────────────────────────────────────
 #
 # Each entry maps a BMW descriptor to a tuple of:
-#   (translation_key, unit, device_class, state_class, precision)
+#   (translation_key, unit, device_class, state_class, precision, numeric)
+#
+# numeric=False sensors report the raw string value instead of a float.
 
-SENSOR_KEY_MAP: Final[dict[str, tuple[str, str | None, str | None, str | None, int | None]]] = {
+SENSOR_KEY_MAP: Final[
+    dict[str, tuple[str, str | None, str | None, str | None, int | None, bool]]
+] = {
     # ── Battery / Charging ───────────────────────────────────────────────
     "vehicle.drivetrain.electricEngine.charging.level": (
-        "battery_level", "%", "battery", "measurement", 0,
+        "battery_level", "%", "battery", "measurement", 0, True,
     ),
     "vehicle.drivetrain.electricEngine.remainingElectricRange": (
-        "range_electric", "km", "distance", "measurement", 0,
+        "range_electric", "km", "distance", "measurement", 0, True,
     ),
     "vehicle.powertrain.electric.battery.charging.power": (
-        "charging_power", "W", "power", "measurement", 0,
+        "charging_power", "W", "power", "measurement", 0, True,
     ),
     "vehicle.drivetrain.electricEngine.charging.status": (
-        "charging_status", None, None, None, None,
+        "charging_status", None, None, None, None, False,
     ),
     "vehicle.powertrain.electric.battery.stateOfCharge.target": (
-        "target_soc", "%", "battery", None, 0,
+        "target_soc", "%", "battery", None, 0, True,
     ),
     "vehicle.drivetrain.batteryManagement.maxEnergy": (
-        "max_battery_energy", "kWh", "energy_storage", None, 1,
+        "max_battery_energy", "kWh", "energy_storage", None, 1, True,
     ),
     "vehicle.vehicle.avgAuxPower": (
-        "avg_aux_power", "W", "power", "measurement", 0,
+        "avg_aux_power", "W", "power", "measurement", 0, True,
     ),
     # ── AC Charging Details ──────────────────────────────────────────────
     "vehicle.drivetrain.electricEngine.charging.acVoltage": (
-        "charging_ac_voltage", "V", "voltage", "measurement", 0,
+        "charging_ac_voltage", "V", "voltage", "measurement", 0, True,
     ),
     "vehicle.drivetrain.electricEngine.charging.acAmpere": (
-        "charging_ac_current", "A", "current", "measurement", 1,
+        "charging_ac_current", "A", "current", "measurement", 1, True,
     ),
     "vehicle.drivetrain.electricEngine.charging.phaseNumber": (
-        "charging_phases", None, None, None, None,
+        "charging_phases", None, None, None, None, True,
     ),
 }
 
 # ── Telemetry Key → Binary Sensor Mapping ────────────────────────────────────
 #
-# Each entry maps a BMW descriptor to a tuple of:
-#   (translation_key, device_class, on_values)
-
-BINARY_SENSOR_KEY_MAP: Final[dict[str, tuple[str, str | None, set[str]]]] = {
-    "vehicle.drivetrain.electricEngine.charging.status": (
-        "charging_active", "battery_charging", {"CHARGINGACTIVE"},
+# Each record is a tuple of:
+#   (telemetry_key, translation_key, device_class, on_values)
+
+BINARY_SENSOR_DESCRIPTORS: Final[
+    tuple[tuple[str, str, str | None, tuple[str, ...]], ...]
+] = (
+    (
+        "vehicle.drivetrain.electricEngine.charging.status",
+        "charging_active", "battery_charging", ("CHARGINGACTIVE",),
     ),
-}
+)
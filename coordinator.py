@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections.abc import Callable, Mapping
 from datetime import timedelta
+from types import MappingProxyType
 from typing import Any
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -27,12 +32,13 @@ from .api import (
 from .auth import BMWAuth, TokenRefreshFailed, TokenResponse
 from .const import (
     CONF_CLIENT_ID,
+    CONF_CONTAINER_ID,
     DEFAULT_CONTAINER_DESCRIPTORS,
     DEFAULT_CONTAINER_NAME,
     DEFAULT_CONTAINER_PURPOSE,
     DEFAULT_POLL_INTERVAL,
     DOMAIN,
-    TOKEN_REFRESH_MARGIN,
+    MQTT_UPDATE_DEBOUNCE,
 )
 from .mqtt_stream import BMWMQTTStream
 
@@ -44,7 +50,8 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
 
     Data is a dict mapping VIN → VehicleData. REST polls update all VINs,
     MQTT updates individual VINs in real-time. Both sources merge into the
-    same VehicleData objects so entities always see the latest state.
+    same VehicleData objects so entities always see the latest state; those
+    objects are never replaced, so entities may hold references to them.
     """
 
     def __init__(
@@ -53,6 +60,7 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
         entry: ConfigEntry,
         vehicles: list[VehicleBasicData],
         tokens: TokenResponse,
+        session: aiohttp.ClientSession,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -62,27 +70,62 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
             update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL),
         )
         self.entry = entry
-        self._vehicles = {v.vin: v for v in vehicles}
         self._tokens = tokens
+        self._refresh_lock = asyncio.Lock()
 
-        session = async_get_clientsession(hass)
         self._auth = BMWAuth(session, entry.data[CONF_CLIENT_ID])
         self._api = BMWCarDataAPI(session)
         self._api.set_token(tokens.access_token)
 
         self._mqtt: BMWMQTTStream | None = None
-        self._container_id: str = ""
-
-        # Initialize vehicle data store
-        self.data: dict[str, VehicleData] = {
-            v.vin: VehicleData(basic=v) for v in vehicles
-        }
+        self._mqtt_flush_handle: asyncio.TimerHandle | None = None
+        # MQTT updates only notify entities of the VINs that changed
+        self._vin_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._dirty_vins: set[str] = set()
+        # Restored from the entry so restarts skip the container lookup
+        self._container_id: str = entry.data.get(CONF_CONTAINER_ID, "")
+
+        # Vehicle map, data store and one shared DeviceInfo per vehicle for
+        # all of its entities, built in a single pass
+        vehicle_map: dict[str, VehicleBasicData] = {}
+        self.data: dict[str, VehicleData] = {}
+        self.device_info: dict[str, DeviceInfo] = {}
+        for v in vehicles:
+            vehicle_map[v.vin] = v
+            self.data[v.vin] = VehicleData(basic=v)
+            self.device_info[v.vin] = DeviceInfo(
+                identifiers={(DOMAIN, v.vin)},
+                name=f"{v.brand} {v.model}",
+                manufacturer=v.brand,
+                model=v.model,
+                serial_number=v.vin,
+            )
+        self._vehicles: Mapping[str, VehicleBasicData] = MappingProxyType(
+            vehicle_map
+        )
 
     @property
-    def vehicles(self) -> dict[str, VehicleBasicData]:
-        """Return the vehicle map (VIN → basic data)."""
+    def vehicles(self) -> Mapping[str, VehicleBasicData]:
+        """Return the read-only vehicle map (VIN → basic data)."""
         return self._vehicles
 
+    @callback
+    def async_add_vin_listener(
+        self, vin: str, update_callback: CALLBACK_TYPE
+    ) -> Callable[[], None]:
+        """Listen for MQTT updates to a single VIN.
+
+        Returns a function that removes the listener.
+        """
+        listeners = self._vin_listeners.setdefault(vin, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
     @property
     def remaining_api_calls(self) -> int:
         """Return remaining REST API calls in the current 24h window."""
@@ -90,15 +133,28 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
 
     # ── Token Management ─────────────────────────────────────────────────
 
+    def _token_is_fresh(self) -> bool:
+        """Return True if the access token is not yet due for refresh."""
+        return time.monotonic() < self._tokens.monotonic_refresh_at
+
     async def _ensure_valid_token(self) -> None:
         """Refresh the access token if it's about to expire.
 
         Persists new tokens to the config entry so they survive restarts.
         Raises ConfigEntryAuthFailed if the refresh token is invalid.
+        Concurrent callers share a single refresh.
         """
-        if time.time() < self._tokens.expiry_timestamp - TOKEN_REFRESH_MARGIN:
+        if self._token_is_fresh():
             return
 
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._token_is_fresh():
+                return
+            await self._refresh_tokens()
+
+    async def _refresh_tokens(self) -> None:
+        """Refresh tokens and propagate them to the API, MQTT and config entry."""
         _LOGGER.debug("Access token expiring soon, refreshing")
         try:
             self._tokens = await self._auth.refresh_tokens(
@@ -115,9 +171,14 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
         if self._mqtt:
             self._mqtt.update_token(self._tokens.id_token)
 
-        # Persist tokens to config entry
-        new_data = {**self.entry.data, "tokens": self._tokens.as_dict()}
-        self.hass.config_entries.async_update_entry(self.entry, data=new_data)
+        # Persist tokens to config entry, skipping the write if nothing changed
+        new_tokens = self._tokens.as_dict()
+        if self.entry.data.get("tokens") == new_tokens:
+            _LOGGER.debug("Tokens refreshed, stored copy already current")
+            return
+        self.hass.config_entries.async_update_entry(
+            self.entry, data={**self.entry.data, "tokens": new_tokens}
+        )
         _LOGGER.debug("Tokens refreshed and persisted")
 
     # ── REST Polling ─────────────────────────────────────────────────────
@@ -142,16 +203,34 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
             _LOGGER.warning("No container ID available — cannot fetch telemetry")
             return self.data
 
-        for vin in self._vehicles:
-            if not vin:
-                continue
-            _LOGGER.debug("Fetching telemetry for VIN: %s", vin)
+        _LOGGER.debug("Fetching telemetry for VINs: %s", list(self._vehicles))
+        results = await asyncio.gather(
+            *(
+                self._fetch_telemetry(vin, self._container_id)
+                for vin in self._vehicles
+                if vin
+            ),
+            return_exceptions=True,
+        )
 
-            try:
-                await self._fetch_telemetry(vin, self._container_id)
-            except RateLimitExceeded:
-                _LOGGER.warning("Rate limit hit — stopping REST polls")
-                break
+        rate_limited = False
+        for result in results:
+            if isinstance(result, ConfigEntryAuthFailed):
+                raise result
+            if isinstance(result, RateLimitExceeded):
+                rate_limited = True
+            elif isinstance(result, BaseException):
+                raise result
+        if rate_limited:
+            _LOGGER.warning("Rate limit hit — some REST polls were skipped")
+
+        # A 404 for one VIN may be vehicle-specific; only a 404 for every
+        # VIN means the stored container is gone
+        if results and all(result is True for result in results):
+            _LOGGER.info(
+                "Container %s not found, will rediscover", self._container_id
+            )
+            self._container_id = ""
 
         return self.data
 
@@ -161,18 +240,25 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
             containers = await self._api.get_containers()
             _LOGGER.debug("Available containers: %s", containers)
 
-            # Reuse any existing container
-            for c in containers:
-                if isinstance(c, dict):
-                    cid = (
-                        c.get("containerId")
+            # Reuse the first container that carries an ID
+            cid = next(
+                (
+                    cid
+                    for c in containers
+                    if isinstance(c, dict)
+                    and (
+                        cid := c.get("containerId")
                         or c.get("id")
-                        or c.get("container_id", "")
+                        or c.get("container_id")
                     )
-                    if cid:
-                        self._container_id = str(cid)
-                        _LOGGER.info("Reusing existing container: %s", cid)
-                        return
+                ),
+                None,
+            )
+            if cid:
+                self._container_id = str(cid)
+                _LOGGER.info("Reusing existing container: %s", cid)
+                self._persist_container_id()
+                return
 
             # No containers found — create one
             _LOGGER.info("No containers found, creating one")
@@ -181,15 +267,30 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
                 purpose=DEFAULT_CONTAINER_PURPOSE,
                 descriptors=DEFAULT_CONTAINER_DESCRIPTORS,
             )
+            self._persist_container_id()
         except APIError as err:
             _LOGGER.error("Container setup failed: %s", err)
         except Exception as err:
             _LOGGER.error("Unexpected error in container setup: %s", err)
 
+    def _persist_container_id(self) -> None:
+        """Store the resolved container ID in the config entry."""
+        if not self._container_id:
+            return
+        if self.entry.data.get(CONF_CONTAINER_ID) == self._container_id:
+            return
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            data={**self.entry.data, CONF_CONTAINER_ID: self._container_id},
+        )
+
     async def _fetch_telemetry(
         self, vin: str, container_id: str
-    ) -> None:
-        """Fetch telemetric data for a single VIN and container."""
+    ) -> bool:
+        """Fetch telemetric data for a single VIN and container.
+
+        Returns True if the API reported the container as not found.
+        """
         try:
             entries = await self._api.get_telematic_data(vin, container_id)
             self._merge_rest_data(vin, entries)
@@ -211,10 +312,12 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
                 "Telemetry error for %s (container=%s): %s",
                 vin, container_id, err,
             )
+            return err.status == 404
         except Exception as err:
             _LOGGER.warning(
                 "Unexpected error fetching telemetry for %s: %s", vin, err
             )
+        return False
 
     def _merge_rest_data(
         self, vin: str, entries: list[TelematicEntry]
@@ -224,16 +327,19 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
             return
 
         vehicle = self.data[vin]
-        for entry in entries:
-            vehicle.telemetry[entry.name] = entry
+        values, units = vehicle.values, vehicle.units
+        for name, value, unit, _timestamp in entries:
+            values[name] = value
+            units[name] = unit
 
         vehicle.rest_updated = time.time()
-        _LOGGER.debug(
-            "REST update for %s: %d entries (total: %d)",
-            vin,
-            len(entries),
-            len(vehicle.telemetry),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "REST update for %s: %d entries (total: %d)",
+                vin,
+                len(entries),
+                len(values),
+            )
 
     # ── MQTT Streaming ───────────────────────────────────────────────────
 
@@ -257,6 +363,10 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
         if self._mqtt:
             await self._mqtt.stop()
             self._mqtt = None
+        if self._mqtt_flush_handle:
+            self._mqtt_flush_handle.cancel()
+            self._mqtt_flush_handle = None
+        self._dirty_vins.clear()
 
     def _on_mqtt_message(self, vin: str, payload: dict[str, Any]) -> None:
         """Handle an incoming MQTT telemetry message.
@@ -266,37 +376,79 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, VehicleData]]):
         and the telemetry data is in the "data" dict using the same format
         as the REST API's telematicData response.
         """
+        # Hot path: skip debug argument packing unless DEBUG is on
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
         # Use VIN from payload if available, fall back to topic-extracted VIN
         msg_vin = payload.get("vin", vin)
         if msg_vin not in self.data:
-            _LOGGER.debug("MQTT data for unknown VIN %s — ignoring", msg_vin)
+            if debug:
+                _LOGGER.debug("MQTT data for unknown VIN %s — ignoring", msg_vin)
             return
 
         vehicle = self.data[msg_vin]
 
         # BMW wraps telemetry in a "data" dict: {descriptor: {value, unit, timestamp}}
         data = payload.get("data") or {}
-        if not isinstance(data, dict):
+        try:
+            items = data.items()
+        except AttributeError:
             _LOGGER.warning("MQTT payload 'data' is not a dict: %s", type(data))
             return
 
+        values, units = vehicle.values, vehicle.units
         count = 0
-        for descriptor, descriptor_payload in data.items():
-            if not isinstance(descriptor_payload, dict):
-                continue
-            value = descriptor_payload.get("value")
-            if value is None:
+        for descriptor, descriptor_payload in items:
+            # Malformed (non-dict) descriptor payloads have no .get()
+            try:
+                value = descriptor_payload.get("value")
+                if value is None:
+                    continue
+                # Most BMW values already arrive as strings
+                if type(value) is not str:
+                    value = str(value)
+                unit = descriptor_payload.get("unit")
+            except AttributeError:
                 continue
-            vehicle.telemetry[descriptor] = TelematicEntry(
-                name=descriptor,
-                value=str(value),
-                unit=descriptor_payload.get("unit"),
-                timestamp=descriptor_payload.get("timestamp", ""),
-            )
+            values[descriptor] = value
+            units[descriptor] = unit
             count += 1
 
-        _LOGGER.debug("MQTT update for %s: %d descriptors", msg_vin, count)
+        if debug:
+            _LOGGER.debug("MQTT update for %s: %d descriptors", msg_vin, count)
         vehicle.mqtt_updated = time.time()
 
-        # Trigger immediate entity refresh
-        self.async_set_updated_data(self.data)
+        # Coalesce bursts of messages into a single entity refresh
+        self._dirty_vins.add(msg_vin)
+        if self._mqtt_flush_handle is None:
+            self._mqtt_flush_handle = self.hass.loop.call_later(
+                MQTT_UPDATE_DEBOUNCE, self._flush_mqtt_updates
+            )
+
+    @callback
+    def _flush_mqtt_updates(self) -> None:
+        """Notify entities of the VINs updated since the last flush.
+
+        Like async_set_updated_data, live data also defers the next REST
+        poll and clears a failed-poll state.
+        """
+        self._mqtt_flush_handle = None
+        dirty, self._dirty_vins = self._dirty_vins, set()
+
+        if not self.last_update_success:
+            # Entities of every VIN went unavailable with the failed poll;
+            # refresh them all (this also reschedules the REST poll)
+            self.async_set_updated_data(self.data)
+            return
+
+        # Streaming data is fresh, so push the next REST poll back a full
+        # interval to save the daily call budget. This is the same
+        # _listeners/_schedule_refresh pair async_set_updated_data runs;
+        # calling it directly lets us skip that method's notify-everyone
+        # loop and only wake the entities of the dirty VINs below.
+        if self._listeners:
+            self._schedule_refresh()
+
+        for vin in dirty:
+            for update_callback in list(self._vin_listeners.get(vin, ())):
+                update_callback()
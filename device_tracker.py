@@ -6,13 +6,12 @@ import logging
 
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BMWCarDataConfigEntry
-from .const import DOMAIN
 from .coordinator import BMWCarDataCoordinator
+from .entity import BMWCarDataEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +20,14 @@ _LAT_KEYS = ("navigation.latitude", "gps.latitude", "position.latitude")
 _LON_KEYS = ("navigation.longitude", "gps.longitude", "position.longitude")
 
 
+def _parse_coordinate(value: str) -> float | None:
+    """Parse a telemetry coordinate string, or None if it isn't numeric."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: BMWCarDataConfigEntry,
@@ -29,19 +36,14 @@ async def async_setup_entry(
     """Set up BMW CarData device tracker entities."""
     coordinator: BMWCarDataCoordinator = entry.runtime_data
 
-    entities: list[BMWDeviceTracker] = []
-    for vin in coordinator.data:
-        entities.append(BMWDeviceTracker(coordinator, vin, entry))
+    async_add_entities(
+        [BMWDeviceTracker(coordinator, vin, entry) for vin in coordinator.data]
+    )
 
-    async_add_entities(entities)
 
-
-class BMWDeviceTracker(
-    CoordinatorEntity[BMWCarDataCoordinator], TrackerEntity
-):
+class BMWDeviceTracker(BMWCarDataEntity, TrackerEntity):
     """Representation of a BMW vehicle location tracker."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "location"
     _attr_icon = "mdi:car"
 
@@ -52,52 +54,52 @@ class BMWDeviceTracker(
         entry: BMWCarDataConfigEntry,
     ) -> None:
         """Initialize the device tracker."""
-        super().__init__(coordinator)
-        self._vin = vin
+        super().__init__(coordinator, vin)
         self._attr_unique_id = f"{vin}_location"
-
-        vehicle = coordinator.vehicles.get(vin)
-        model = vehicle.model if vehicle else "Unknown"
-        brand = vehicle.brand if vehicle else "BMW"
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, vin)},
-            "name": f"{brand} {model}",
-            "manufacturer": brand,
-            "model": model,
-            "serial_number": vin,
-        }
+        self._attr_device_info = coordinator.device_info[vin]
+        # Key that last yielded a coordinate; a vehicle's schema is stable
+        self._lat_key: str | None = None
+        self._lon_key: str | None = None
+        self._update_coordinates()
 
     @property
     def source_type(self) -> SourceType:
         """Return the source type."""
         return SourceType.GPS
 
-    @property
-    def latitude(self) -> float | None:
-        """Return the latitude of the vehicle."""
-        return self._get_coordinate(_LAT_KEYS)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Resolve the coordinates once per update, then write state."""
+        self._update_coordinates()
+        super()._handle_coordinator_update()
+
+    def _update_coordinates(self) -> None:
+        """Store the current latitude/longitude on the entity attributes."""
+        vehicle = (
+            self.coordinator.data.get(self._vin) if self.coordinator.data else None
+        )
+        if not vehicle:
+            self._attr_latitude = self._attr_longitude = None
+            return
 
-    @property
-    def longitude(self) -> float | None:
-        """Return the longitude of the vehicle."""
-        return self._get_coordinate(_LON_KEYS)
+        values = vehicle.values
+        self._attr_latitude = self._get_coordinate(values, _LAT_KEYS, "_lat_key")
+        self._attr_longitude = self._get_coordinate(values, _LON_KEYS, "_lon_key")
 
-    def _get_coordinate(self, keys: tuple[str, ...]) -> float | None:
+    def _get_coordinate(
+        self, values: dict[str, str], keys: tuple[str, ...], cache_attr: str
+    ) -> float | None:
         """Try multiple telemetry keys to find a coordinate value."""
-        if not self.coordinator.data:
-            return None
-
-        vehicle = self.coordinator.data.get(self._vin)
-        if not vehicle:
-            return None
+        cached_key = getattr(self, cache_attr)
+        if cached_key is not None and (value := values.get(cached_key)):
+            coordinate = _parse_coordinate(value)
+            if coordinate is not None:
+                return coordinate
 
         for key in keys:
-            entry = vehicle.telemetry.get(key)
-            if entry:
-                try:
-                    return float(entry.value)
-                except (ValueError, TypeError):
-                    continue
+            value = values.get(key)
+            if value and (coordinate := _parse_coordinate(value)) is not None:
+                setattr(self, cache_attr, key)
+                return coordinate
 
         return None
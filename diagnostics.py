@@ -14,10 +14,10 @@ REDACT_KEYS = {"access_token", "refresh_token", "id_token", "gcid", "code_verifi
 
 def _redact(data: dict[str, Any]) -> dict[str, Any]:
     """Redact sensitive values from a dict."""
-    return {
-        k: "**REDACTED**" if k in REDACT_KEYS else v
-        for k, v in data.items()
-    }
+    redacted = dict(data)
+    for key in REDACT_KEYS.intersection(redacted):
+        redacted[key] = "**REDACTED**"
+    return redacted
 
 
 async def async_get_config_entry_diagnostics(
@@ -41,8 +41,8 @@ async def async_get_config_entry_diagnostics(
                 "propulsion": vehicle_data.basic.propulsion,
                 "construction_year": vehicle_data.basic.construction_year,
             },
-            "telemetry_count": len(vehicle_data.telemetry),
-            "telemetry_keys": sorted(vehicle_data.telemetry.keys()),
+            "telemetry_count": len(vehicle_data.values),
+            "telemetry_keys": list(vehicle_data.sorted_telemetry_keys()),
             "rest_updated": vehicle_data.rest_updated,
             "mqtt_updated": vehicle_data.mqtt_updated,
         }
@@ -0,0 +1,27 @@
+"""Base entity for BMW CarData integration."""
+
+from __future__ import annotations
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import BMWCarDataCoordinator
+
+
+class BMWCarDataEntity(CoordinatorEntity[BMWCarDataCoordinator]):
+    """Common base for entities that belong to a single vehicle."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: BMWCarDataCoordinator, vin: str) -> None:
+        """Initialize the entity for the given VIN."""
+        super().__init__(coordinator)
+        self._vin = vin
+
+    async def async_added_to_hass(self) -> None:
+        """Also refresh on MQTT updates for this entity's VIN."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_vin_listener(
+                self._vin, self._handle_coordinator_update
+            )
+        )
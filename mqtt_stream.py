@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import random
 import ssl
 from collections.abc import Callable
 from typing import Any
 
+import orjson
+
 from .const import (
     MQTT_BROKER,
     MQTT_KEEPALIVE,
@@ -22,6 +24,30 @@ _LOGGER = logging.getLogger(__name__)
 # Type for the callback invoked when new telemetry arrives
 TelemetryCallback = Callable[[str, dict[str, Any]], None]
 
+# Built once (off the event loop) and shared by every reconnect
+_SSL_CONTEXT: ssl.SSLContext | None = None
+
+
+async def _async_get_ssl_context() -> ssl.SSLContext:
+    """Return the shared TLS context, creating it on first use."""
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        # ssl.create_default_context() does blocking I/O (loads root certs)
+        # so it must run in an executor to avoid blocking HA's event loop
+        loop = asyncio.get_running_loop()
+        context = await loop.run_in_executor(None, ssl.create_default_context)
+        # Require at least TLS 1.2, allow negotiation up to TLS 1.3
+        context.minimum_version = ssl.TLSVersion.TLSv1_2
+        _SSL_CONTEXT = context
+    return _SSL_CONTEXT
+
+
+def _token_hint(id_token: str) -> str:
+    """Return a truncated id_token description that is safe to log."""
+    if not id_token:
+        return "(empty), token_len=0"
+    return f"{id_token[:20]}...{id_token[-10:]}, token_len={len(id_token)}"
+
 
 class BMWMQTTStream:
     """MQTT streaming client for real-time BMW vehicle telemetry.
@@ -47,8 +73,11 @@ class BMWMQTTStream:
             callback: Called with (vin, payload_dict) on each message.
         """
         self._id_token = id_token
+        self._token_hint = _token_hint(id_token)
         self._gcid = gcid
         self._vins = vins
+        # BMW publishes to {gcid}/{vin}; resolve known topics with one lookup
+        self._topic_vin: dict[str, str] = {f"{gcid}/{vin}": vin for vin in vins}
         self._callback = callback
         self._task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
@@ -57,6 +86,7 @@ class BMWMQTTStream:
     def update_token(self, id_token: str) -> None:
         """Update the id_token for the next reconnection."""
         self._id_token = id_token
+        self._token_hint = _token_hint(id_token)
 
     async def start(self) -> None:
         """Start the MQTT streaming loop in a background task."""
@@ -110,14 +140,16 @@ class BMWMQTTStream:
                         "Check that your BMW account has streaming access."
                     )
                     return
+                # Jitter so many clients don't reconnect in lockstep
+                delay = random.uniform(self._backoff / 2, self._backoff)
                 _LOGGER.warning(
-                    "MQTT connection failed, reconnecting in %ds: %s",
-                    self._backoff,
+                    "MQTT connection failed, reconnecting in %.1fs: %s",
+                    delay,
                     err,
                 )
                 try:
                     await asyncio.wait_for(
-                        self._stop_event.wait(), timeout=self._backoff
+                        self._stop_event.wait(), timeout=delay
                     )
                     # If we get here, stop was requested
                     return
@@ -128,28 +160,20 @@ class BMWMQTTStream:
 
     async def _connect_and_listen(self, aiomqtt: Any) -> None:
         """Connect to the MQTT broker and process messages."""
-        # ssl.create_default_context() does blocking I/O (loads root certs)
-        # so it must run in an executor to avoid blocking HA's event loop
-        loop = asyncio.get_event_loop()
-        ssl_context = await loop.run_in_executor(None, ssl.create_default_context)
-
-        # Require at least TLS 1.2, allow negotiation up to TLS 1.3
-        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        ssl_context = await _async_get_ssl_context()
 
         # Client ID must be exactly the gcid — any suffix causes auth rejection
         client_id = self._gcid
 
-        _LOGGER.debug(
-            "Connecting to MQTT broker %s:%d as %s "
-            "(gcid=%s, id_token=%s...%s, token_len=%d)",
-            MQTT_BROKER,
-            MQTT_PORT,
-            client_id,
-            self._gcid or "(empty)",
-            self._id_token[:20] if self._id_token else "(empty)",
-            self._id_token[-10:] if self._id_token else "",
-            len(self._id_token) if self._id_token else 0,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Connecting to MQTT broker %s:%d as %s (gcid=%s, id_token=%s)",
+                MQTT_BROKER,
+                MQTT_PORT,
+                client_id,
+                self._gcid or "(empty)",
+                self._token_hint,
+            )
 
         async with aiomqtt.Client(
             hostname=MQTT_BROKER,
@@ -169,32 +193,35 @@ class BMWMQTTStream:
             await client.subscribe(topic)
             _LOGGER.debug("Subscribed to %s", topic)
 
+            # stop() cancels the task, which unwinds this loop
             async for message in client.messages:
-                if self._stop_event.is_set():
-                    break
                 self._handle_message(message)
 
     def _handle_message(self, message: Any) -> None:
         """Parse an MQTT message and invoke the callback."""
         try:
-            topic = str(message.topic)
-            payload = json.loads(message.payload.decode("utf-8"))
-
-            # Extract VIN from topic: {gcid}/{vin}
-            parts = topic.split("/")
-            if len(parts) >= 2:
-                vin = parts[1]
-            else:
-                _LOGGER.warning("Unexpected MQTT topic format: %s", topic)
-                return
+            topic = message.topic.value
+            # orjson parses the raw bytes, no intermediate str
+            payload = orjson.loads(message.payload)
+
+            vin = self._topic_vin.get(topic)
+            if vin is None:
+                # Unknown topic — extract VIN from {gcid}/{vin}
+                parts = topic.split("/")
+                if len(parts) >= 2:
+                    vin = parts[1]
+                else:
+                    _LOGGER.warning("Unexpected MQTT topic format: %s", topic)
+                    return
 
-            _LOGGER.debug(
-                "MQTT message on %s (VIN=%s): %s",
-                topic, vin, type(payload).__name__,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "MQTT message on %s (VIN=%s): %s",
+                    topic, vin, type(payload).__name__,
+                )
             self._callback(vin, payload)
 
-        except (json.JSONDecodeError, UnicodeDecodeError) as err:
+        except orjson.JSONDecodeError as err:
             _LOGGER.warning("Failed to parse MQTT message: %s", err)
         except Exception:
             _LOGGER.exception("Error handling MQTT message")
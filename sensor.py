@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -14,12 +15,12 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BMWCarDataConfigEntry
 from .api import VehicleData
-from .const import DOMAIN, SENSOR_KEY_MAP
+from .const import SENSOR_KEY_MAP
 from .coordinator import BMWCarDataCoordinator
+from .entity import BMWCarDataEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,8 +50,15 @@ class BMWSensorEntityDescription(SensorEntityDescription):
     """Describe a BMW CarData sensor entity."""
 
     telemetry_key: str
+    # Whether values are parsed as floats; False returns the raw string
+    numeric: bool = True
 
 
+# Zero-width split point between a lowercase and an uppercase letter
+_CAMEL_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def _friendly_name(telemetry_key: str) -> str:
     """Convert a BMW telemetry key to a friendly name.
 
@@ -59,53 +67,65 @@ def _friendly_name(telemetry_key: str) -> str:
     # Take the last segment after the last dot
     name = telemetry_key.rsplit(".", 1)[-1]
     # Insert spaces before uppercase letters (camelCase → Camel Case)
-    name = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", name)
+    name = _CAMEL_RE.sub(" ", name)
     return name.replace("_", " ").title()
 
 
+def _build_predefined_descriptions() -> tuple[BMWSensorEntityDescription, ...]:
+    """Build sensor descriptions from SENSOR_KEY_MAP."""
+    return tuple(
+        BMWSensorEntityDescription(
+            key=translation_key,
+            translation_key=translation_key,
+            telemetry_key=telemetry_key,
+            native_unit_of_measurement=unit,
+            device_class=_DEVICE_CLASS_MAP.get(device_class_str) if device_class_str else None,
+            state_class=_STATE_CLASS_MAP.get(state_class_str) if state_class_str else None,
+            suggested_display_precision=precision,
+            numeric=numeric,
+        )
+        for telemetry_key, (
+            translation_key,
+            unit,
+            device_class_str,
+            state_class_str,
+            precision,
+            numeric,
+        ) in SENSOR_KEY_MAP.items()
+    )
+
+
+# Predefined descriptions depend only on constants, so build them once
+_PREDEFINED_DESCRIPTIONS = _build_predefined_descriptions()
+_PREDEFINED_KEYS = frozenset(SENSOR_KEY_MAP)
+
+# Upper-cased telemetry values that indicate a binary state, not a sensor
+_BINARY_VALUES: frozenset[str] = frozenset({
+    "OPEN", "CLOSED", "LOCKED", "UNLOCKED", "SECURED",
+    "TRUE", "FALSE", "CONNECTED", "DISCONNECTED",
+    "CHARGING", "NOT_CHARGING",
+})
+
+
 def _build_descriptions(
     vehicle_data: VehicleData,
 ) -> list[BMWSensorEntityDescription]:
     """Build sensor descriptions from predefined map + dynamic discovery."""
-    descriptions: list[BMWSensorEntityDescription] = []
-    seen_keys: set[str] = set()
-
-    # Predefined sensors from SENSOR_KEY_MAP
-    for telemetry_key, (
-        translation_key,
-        unit,
-        device_class_str,
-        state_class_str,
-        precision,
-    ) in SENSOR_KEY_MAP.items():
-        seen_keys.add(telemetry_key)
-        descriptions.append(
-            BMWSensorEntityDescription(
-                key=translation_key,
-                translation_key=translation_key,
-                telemetry_key=telemetry_key,
-                native_unit_of_measurement=unit,
-                device_class=_DEVICE_CLASS_MAP.get(device_class_str) if device_class_str else None,
-                state_class=_STATE_CLASS_MAP.get(state_class_str) if state_class_str else None,
-                suggested_display_precision=precision,
-            )
-        )
+    descriptions = list(_PREDEFINED_DESCRIPTIONS)
 
     # Dynamic sensors for any telemetry keys not in the predefined map
-    for telemetry_key, entry in vehicle_data.telemetry.items():
-        if telemetry_key in seen_keys:
+    for telemetry_key, value in vehicle_data.values.items():
+        if telemetry_key in _PREDEFINED_KEYS:
+            continue
+        if not value:
             continue
         # Skip keys that look like binary sensors (common values)
-        if entry.value.upper() in (
-            "OPEN", "CLOSED", "LOCKED", "UNLOCKED", "SECURED",
-            "TRUE", "FALSE", "CONNECTED", "DISCONNECTED",
-            "CHARGING", "NOT_CHARGING",
-        ):
+        if value.upper() in _BINARY_VALUES:
             continue
 
         # Try to parse as a number — only create sensor if it's numeric
         try:
-            float(entry.value)
+            float(value)
         except (ValueError, TypeError):
             continue
 
@@ -115,7 +135,7 @@ def _build_descriptions(
                 key=safe_key,
                 translation_key=safe_key,
                 telemetry_key=telemetry_key,
-                native_unit_of_measurement=entry.unit,
+                native_unit_of_measurement=vehicle_data.units.get(telemetry_key),
                 name=_friendly_name(telemetry_key),
                 state_class=SensorStateClass.MEASUREMENT,
             )
@@ -132,22 +152,19 @@ async def async_setup_entry(
     """Set up BMW CarData sensor entities."""
     coordinator: BMWCarDataCoordinator = entry.runtime_data
 
-    entities: list[BMWSensor] = []
-    for vin, vehicle_data in coordinator.data.items():
-        descriptions = _build_descriptions(vehicle_data)
-        for desc in descriptions:
-            entities.append(BMWSensor(coordinator, desc, vin, entry))
-
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            BMWSensor(coordinator, desc, vin, entry)
+            for vin, vehicle_data in coordinator.data.items()
+            for desc in _build_descriptions(vehicle_data)
+        ]
+    )
 
 
-class BMWSensor(
-    CoordinatorEntity[BMWCarDataCoordinator], SensorEntity
-):
+class BMWSensor(BMWCarDataEntity, SensorEntity):
     """Representation of a BMW CarData sensor."""
 
     entity_description: BMWSensorEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -157,39 +174,25 @@ class BMWSensor(
         entry: BMWCarDataConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, vin)
         self.entity_description = description
-        self._vin = vin
+        # VehicleData objects live for the coordinator's lifetime and their
+        # values dict is updated in place, so the reference stays valid
+        self._values = coordinator.data[vin].values
+        self._telemetry_key = description.telemetry_key
         self._attr_unique_id = f"{vin}_{description.key}"
-
-        vehicle = coordinator.vehicles.get(vin)
-        model = vehicle.model if vehicle else "Unknown"
-        brand = vehicle.brand if vehicle else "BMW"
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, vin)},
-            "name": f"{brand} {model}",
-            "manufacturer": brand,
-            "model": model,
-            "serial_number": vin,
-        }
+        self._attr_device_info = coordinator.device_info[vin]
 
     @property
     def native_value(self) -> float | str | None:
         """Return the sensor value."""
-        if not self.coordinator.data:
+        value = self._values.get(self._telemetry_key)
+        if not value:
             return None
 
-        vehicle = self.coordinator.data.get(self._vin)
-        if not vehicle:
-            return None
-
-        entry = vehicle.telemetry.get(self.entity_description.telemetry_key)
-        if not entry:
-            return None
-
-        # Try to return as numeric value
+        if not self.entity_description.numeric:
+            return value
         try:
-            return float(entry.value)
-        except (ValueError, TypeError):
-            return entry.value
+            return float(value)
+        except ValueError:
+            return None